@@ -0,0 +1 @@
+"""Benchmarks for the Codeforces Progress Tracker."""
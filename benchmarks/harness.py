@@ -0,0 +1,88 @@
+"""Helpers to drive CodeforcesTracker without a user at the keyboard."""
+import sqlite3
+import tkinter as tk
+from tkinter import messagebox, simpledialog
+
+import matplotlib
+
+matplotlib.use("Agg")  # Figures are measured, never shown
+
+from codeforces_tracker import CodeforcesTracker  # noqa: E402
+
+# Every dialog the tracker tried to show, as (kind, title, message)
+DIALOGS = []
+
+
+def _record(kind, result=None):
+    def dialog(title=None, message=None, *args, **kwargs):
+        DIALOGS.append((kind, title, message))
+        return result
+    return dialog
+
+
+def install_dialog_hooks():
+    """Replace blocking dialogs with recorders that answer 'no' / cancel."""
+    messagebox.showinfo = _record("info")
+    messagebox.showerror = _record("error")
+    messagebox.askyesno = _record("askyesno", False)
+    simpledialog.askstring = _record("askstring")
+    simpledialog.askinteger = _record("askinteger")
+    simpledialog.askfloat = _record("askfloat")
+
+
+def errors_since(mark):
+    """Return error dialogs recorded after DIALOGS had `mark` entries."""
+    return [d for d in DIALOGS[mark:] if d[0] == "error"]
+
+
+def seed_user(db_path, handle, rating):
+    """Store a handle and rating so the tracker does not prompt for them."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE IF NOT EXISTS user_info (id INTEGER PRIMARY KEY AUTOINCREMENT, handle TEXT)")
+    conn.execute("CREATE TABLE IF NOT EXISTS user_rating (id INTEGER PRIMARY KEY AUTOINCREMENT, rating INTEGER)")
+    if conn.execute("SELECT COUNT(*) FROM user_info").fetchone()[0] == 0:
+        conn.execute("INSERT INTO user_info (handle) VALUES (?)", (handle,))
+        conn.execute("INSERT INTO user_rating (rating) VALUES (?)", (rating,))
+    conn.commit()
+    conn.close()
+
+
+def pending_after(root):
+    """Return the ids of callbacks scheduled with root.after."""
+    return root.tk.splitlist(root.tk.call("after", "info"))
+
+
+def cancel_pending(root):
+    """Cancel every scheduled callback, e.g. the startup auto-sync."""
+    for after_id in pending_after(root):
+        root.after_cancel(after_id)
+
+
+def make_tracker(db_path, api_base, handle="tourist", rating=1600, keep_schedule=False):
+    """
+    Build a tracker on a hidden root window, pointed at a mock API.
+
+    Args:
+        db_path (str): database file to use
+        api_base (str): base URL of the (mock) Codeforces API
+        handle (str): Codeforces handle to seed
+        rating (int): virtualized rating to seed
+        keep_schedule (bool): If True, leaves the startup auto-sync scheduled
+    """
+    install_dialog_hooks()
+    seed_user(db_path, handle, rating)
+    CodeforcesTracker.API_BASE = api_base
+    CodeforcesTracker.API_DELAY = 0
+
+    root = tk.Tk()
+    root.withdraw()
+    tracker = CodeforcesTracker(root, db_path)
+    if not keep_schedule:
+        cancel_pending(root)
+    return tracker
+
+
+def close_tracker(tracker):
+    """Destroy the tracker's window and close its database."""
+    tracker.root.destroy()
+    tracker.conn.close()
@@ -0,0 +1,110 @@
+"""A local mock of the Codeforces API that serves synthetic data."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class MockCodeforcesAPI:
+    """
+    Serve user.status, contest.status, contest.standings and problemset.problems
+    from in-memory data.
+
+    Usage:
+        with MockCodeforcesAPI(histories={"tourist": history}) as api:
+            CodeforcesTracker.API_BASE = api.url
+    """
+
+    def __init__(self, histories=None, problemset=None, contests=None, host="127.0.0.1", port=0):
+        self.histories = histories or {}  # handle -> submissions, newest first
+        self.problemset = problemset or []
+        self.contests = contests or {}  # contest id -> contest dict, as in contest.standings
+        self.request_count = 0
+        self.lock = threading.Lock()
+
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                api.handle(self)
+
+            def log_message(self, format, *args):
+                pass  # Keep benchmark output clean
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.url = f"http://{host}:{self.server.server_port}/api"
+        self.thread = None
+
+    def start(self):
+        """Start serving in a background thread."""
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server and release its socket."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def add_submissions(self, handle, submissions):
+        """Prepend new submissions (newest first) to a handle's history."""
+        with self.lock:
+            self.histories[handle] = list(submissions) + self.histories.get(handle, [])
+
+    def handle(self, request):
+        """Route a request to the matching API method."""
+        url = urlparse(request.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        method = url.path.rsplit("/", 1)[-1]
+        with self.lock:
+            self.request_count += 1
+
+        if method == "user.status":
+            status, body = self.user_status(params)
+        elif method == "contest.status":
+            status, body = self.contest_status(params)
+        elif method == "contest.standings":
+            contest = self.contests.get(int(params.get("contestId", 0)))
+            if contest is None:
+                status, body = 400, {"status": "FAILED", "comment": "contestId: Contest not found"}
+            else:
+                status, body = 200, {"status": "OK", "result": {"contest": contest, "problems": [], "rows": []}}
+        elif method == "problemset.problems":
+            status, body = 200, {"status": "OK", "result": {"problems": self.problemset, "problemStatistics": []}}
+        else:
+            status, body = 404, {"status": "FAILED", "comment": f"Unknown method {method}"}
+
+        payload = json.dumps(body).encode()
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(payload)))
+        request.end_headers()
+        request.wfile.write(payload)
+
+    def user_status(self, params):
+        handle = params.get("handle")
+        with self.lock:
+            if handle not in self.histories:
+                return 400, {"status": "FAILED", "comment": f"handle: User with handle {handle} not found"}
+            history = self.histories[handle]
+        start = int(params.get("from", 1)) - 1
+        count = int(params.get("count", len(history)))
+        return 200, {"status": "OK", "result": history[start:start + count]}
+
+    def contest_status(self, params):
+        contest_id = int(params.get("contestId", 0))
+        handle = params.get("handle")
+        with self.lock:
+            if contest_id not in self.contests:
+                return 400, {"status": "FAILED", "comment": "contestId: Contest not found"}
+            history = self.histories.get(handle, [])
+        submissions = [s for s in history if s["contestId"] == contest_id]
+        start = int(params.get("from", 1)) - 1
+        count = int(params.get("count", len(submissions)))
+        return 200, {"status": "OK", "result": submissions[start:start + count]}
@@ -0,0 +1,203 @@
+"""
+Benchmark the tracker against a mock Codeforces API.
+
+Usage:
+    python -m benchmarks.run                          # 1k and 10k histories
+    python -m benchmarks.run --sizes 1k,10k,100k --save main
+    python -m benchmarks.run --compare main           # exit 1 on regressions
+
+Needs a display for Tk; on a headless machine run it under xvfb-run.
+"""
+import argparse
+import datetime
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+from benchmarks.harness import DIALOGS, close_tracker, errors_since, make_tracker
+from benchmarks.mock_api import MockCodeforcesAPI
+from benchmarks.synthetic import generate_history, generate_problemset
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+HANDLE = "tourist"
+RATING = 1600
+INCREMENTAL = 50  # New submissions fetched by the incremental sync scenario
+
+
+def parse_size(text):
+    """Parse '1k', '10k' or '100000' into an int."""
+    text = text.strip().lower()
+    return int(float(text[:-1]) * 1000) if text.endswith("k") else int(text)
+
+
+def summarize(samples, items_per_sample):
+    """Latency percentiles in milliseconds and throughput in items per second."""
+    ms = sorted(s * 1000 for s in samples)
+    if len(ms) > 1:
+        cuts = statistics.quantiles(ms, n=100, method="inclusive")
+        p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+    else:
+        p50 = p90 = p99 = ms[0]
+    return {
+        "samples": len(ms),
+        "mean_ms": statistics.fmean(ms),
+        "p50_ms": p50,
+        "p90_ms": p90,
+        "p99_ms": p99,
+        "throughput": items_per_sample * len(ms) / (sum(samples) or 1e-9),
+    }
+
+
+def timed(func, repeat):
+    """Call func() `repeat` times, returning the duration of each call."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def checked_sync(tracker, full_history):
+    """Run a sync and fail loudly if it reported an error."""
+    mark = len(DIALOGS)
+    tracker.sync_with_codeforces(full_history=full_history)
+    errors = errors_since(mark)
+    if errors:
+        raise RuntimeError(f"Sync failed: {errors[0][2]}")
+
+
+def bench_size(size, repeat, queries, workdir):
+    """Run every scenario against a history of `size` submissions."""
+    results = {}
+    problemset = generate_problemset()
+    history = generate_history(size, handle=HANDLE, user_rating=RATING, problemset=problemset)
+
+    # The newest submission's contest is treated as running, for contest mode
+    live_contest = history[0]["contestId"]
+    contests = {live_contest: {
+        "id": live_contest, "name": f"Round {live_contest}", "type": "CF", "phase": "CODING",
+        "durationSeconds": 7200, "startTimeSeconds": history[0]["creationTimeSeconds"] - 3600,
+    }}
+
+    with MockCodeforcesAPI(histories={HANDLE: history}, problemset=problemset, contests=contests) as api:
+        # Full backfill into a fresh database each time
+        samples = []
+        for i in range(repeat):
+            db_path = os.path.join(workdir, f"backfill-{size}-{i}.db")
+            tracker = make_tracker(db_path, api.url, HANDLE, RATING)
+            start = time.perf_counter()
+            checked_sync(tracker, full_history=True)
+            samples.append(time.perf_counter() - start)
+            close_tracker(tracker)
+        results["full_backfill"] = summarize(samples, len(history))
+        synced_db = db_path
+
+        # Incremental sync of the newest submissions on top of an older backfill
+        template = os.path.join(workdir, f"incremental-{size}.db")
+        api.histories[HANDLE] = history[INCREMENTAL:]
+        tracker = make_tracker(template, api.url, HANDLE, RATING)
+        checked_sync(tracker, full_history=True)
+        # A full sync keeps the seeded "yesterday" marker if it is newer, so set it explicitly
+        tracker.update_last_submission_time(history[INCREMENTAL]["creationTimeSeconds"])
+        close_tracker(tracker)
+        api.histories[HANDLE] = history
+
+        samples = []
+        for i in range(repeat):
+            db_path = os.path.join(workdir, f"incremental-{size}-{i}.db")
+            shutil.copyfile(template, db_path)
+            tracker = make_tracker(db_path, api.url, HANDLE, RATING)
+            start = time.perf_counter()
+            checked_sync(tracker, full_history=False)
+            samples.append(time.perf_counter() - start)
+            close_tracker(tracker)
+        results["incremental_sync"] = summarize(samples, INCREMENTAL)
+
+        # Read paths against the fully synced database
+        tracker = make_tracker(synced_db, api.url, HANDLE, RATING)
+        today = tracker.today
+        results["today_score"] = summarize(timed(tracker.get_today_score, queries), 1)
+        for days in (30, 365):
+            start_date = today - datetime.timedelta(days=days - 1)
+            samples = timed(lambda: tracker.get_daily_scores(start_date, today), queries)
+            results[f"chart_{days}"] = summarize(samples, days)
+        photo = tk.PhotoImage(master=tracker.root)
+        for years in (1, 5, 10):
+            samples = timed(lambda: tracker.render_heatmap(photo, tracker.get_heatmap_grid(years)[1]), queries)
+            results[f"heatmap_{years}y"] = summarize(samples, 1)
+        terms = ["1700", str(today), "A", "1999"]
+        samples = timed(lambda: [tracker.query_records(term) for term in terms], queries)
+        results["record_search"] = summarize([s / len(terms) for s in samples], 1)
+
+        # One contest.status round trip and scoring pass per poll
+        tracker.start_contest_mode(live_contest)
+        samples = timed(tracker.poll_contest, queries)
+        results["contest_poll"] = summarize(samples, 1)
+        tracker.stop_contest_mode()
+        close_tracker(tracker)
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print p50 ratios against a baseline; return the regressed keys."""
+    regressions = []
+    print(f"\n{'scenario':<28}{'baseline p50':>14}{'current p50':>14}{'ratio':>8}")
+    for key, current in results.items():
+        if key not in baseline:
+            continue
+        ratio = current["p50_ms"] / max(baseline[key]["p50_ms"], 1e-9)
+        flag = "  REGRESSION" if ratio > 1 + threshold else ""
+        if flag:
+            regressions.append(key)
+        print(f"{key:<28}{baseline[key]['p50_ms']:>12.2f}ms{current['p50_ms']:>12.2f}ms{ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1k,10k", help="history sizes, e.g. 1k,10k,100k")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per sync scenario")
+    parser.add_argument("--queries", type=int, default=200, help="runs per read scenario")
+    parser.add_argument("--save", metavar="NAME", help="save results as baselines/NAME.json")
+    parser.add_argument("--compare", metavar="NAME", help="compare against baselines/NAME.json")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed p50 slowdown (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    workdir = tempfile.mkdtemp(prefix="cf-bench-")
+    try:
+        for size in (parse_size(s) for s in args.sizes.split(",")):
+            for scenario, stats in bench_size(size, args.repeat, args.queries, workdir).items():
+                results[f"{scenario}@{size}"] = stats
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"{'scenario':<28}{'p50':>10}{'p90':>10}{'p99':>10}{'throughput':>16}")
+    for key, stats in results.items():
+        print(f"{key:<28}{stats['p50_ms']:>8.2f}ms{stats['p90_ms']:>8.2f}ms{stats['p99_ms']:>8.2f}ms"
+              f"{stats['throughput']:>12.1f}/s")
+
+    if args.save:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        path = os.path.join(BASELINE_DIR, f"{args.save}.json")
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved baseline to {path}")
+
+    if args.compare:
+        with open(os.path.join(BASELINE_DIR, f"{args.compare}.json")) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
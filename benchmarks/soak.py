@@ -0,0 +1,205 @@
+"""
+Soak-test the tracker for memory and handle leaks over simulated days.
+
+Each simulated hour new submissions appear on a mock Codeforces API and the
+"user" presses sync, opens the graph, records (twice) and heatmap windows and
+closes them again. After every hour the harness samples RSS, traced Python
+memory, open matplotlib figures, pending root.after callbacks, Tk images,
+the windows that were open before closing them and database size, and fails
+if any of them keeps growing.
+
+Usage:
+    python -m benchmarks.soak --days 14
+    python -m benchmarks.soak --days 60 --ticks-per-day 4 --output soak.json
+
+Needs a display for Tk; on a headless machine run it under xvfb-run.
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import tkinter as tk
+import tracemalloc
+
+import matplotlib.pyplot as plt
+
+from benchmarks.harness import DIALOGS, close_tracker, errors_since, make_tracker, pending_after
+from benchmarks.mock_api import MockCodeforcesAPI
+from benchmarks.synthetic import generate_history, generate_problemset
+
+HANDLE = "tourist"
+RATING = 1600
+
+# Largest growth allowed between the first and last quarter of the run (after warm-up)
+LIMITS = {
+    "rss_mb": 50,
+    "traced_mb": 10,
+    "figures": 0,
+    "after_callbacks": 1,
+    "tk_images": 0,
+    "windows": 0,
+    "db_bytes_per_row": 64,
+}
+
+
+def rss_bytes():
+    """Current resident set size, or the peak where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def count_windows(root):
+    """Number of open popups."""
+    return sum(isinstance(w, tk.Toplevel) for w in root.winfo_children())
+
+
+def sample(tracker, windows):
+    """Measure everything that should stay flat while the widget is open."""
+    gc.collect()
+    root = tracker.root
+    rows = tracker.cursor.execute("SELECT COUNT(*) FROM problems").fetchone()[0]
+    db_bytes = os.path.getsize(tracker.db_path)
+    return {
+        "rss_mb": rss_bytes() / 2 ** 20,
+        "traced_mb": tracemalloc.get_traced_memory()[0] / 2 ** 20,
+        "figures": len(plt.get_fignums()),
+        "after_callbacks": len(pending_after(root)),
+        "tk_images": len(root.tk.splitlist(root.tk.call("image", "names"))),
+        "windows": windows,
+        "db_kb": db_bytes / 1024,
+        "db_bytes_per_row": db_bytes / max(rows, 1),
+        "rows": rows,
+    }
+
+
+def new_submissions(count, end_time, problemset, seed):
+    """Synthetic submissions made in the minutes before end_time, newest first."""
+    submissions = generate_history(count, handle=HANDLE, user_rating=RATING, end_time=end_time,
+                                   days=1, problemset=problemset, seed=seed)
+    for i, submission in enumerate(submissions):
+        submission["creationTimeSeconds"] = end_time - i * 60
+        submission["id"] = end_time * 100 - i  # Keep ids increasing over time
+    return submissions
+
+
+def close_windows(root):
+    """Close every popup, as the user would."""
+    for widget in root.winfo_children():
+        if isinstance(widget, tk.Toplevel):
+            widget.destroy()
+    root.update()
+
+
+def simulate_hour(tracker, api, when, problemset, per_tick, seed):
+    """One simulated hour of new solves and window juggling; returns the windows left open."""
+    api.add_submissions(HANDLE, new_submissions(per_tick, int(when.timestamp()), problemset, seed))
+    tracker.today = when.date()
+
+    mark = len(DIALOGS)
+    tracker.sync_with_codeforces()  # Manual "Sync New Submissions"
+    errors = errors_since(mark)
+    if errors:
+        raise RuntimeError(f"Sync failed: {errors[0][2]}")
+
+    tracker.show_graph()
+    tracker.manage_records()
+    opened = count_windows(tracker.root)
+    tracker.manage_records()  # A second click should not open a second window
+    if count_windows(tracker.root) != opened:
+        raise RuntimeError("Manage Records opened a second window")
+    tracker.show_heatmap()
+    tracker.root.update()
+    windows = count_windows(tracker.root)  # Count before closing, or a pile-up would never show
+    close_windows(tracker.root)
+    return windows
+
+
+def check_growth(samples, warmup):
+    """Compare the first and last quarter of the post-warm-up samples against LIMITS."""
+    steady = samples[warmup:]
+    quarter = max(1, len(steady) // 4)
+    report = []
+    for metric, limit in LIMITS.items():
+        first = statistics.fmean(s[metric] for s in steady[:quarter])
+        last = statistics.fmean(s[metric] for s in steady[-quarter:])
+        report.append((metric, first, last, last - first, limit, last - first <= limit))
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=7, help="simulated days")
+    parser.add_argument("--ticks-per-day", type=int, default=24, help="simulated hours per day")
+    parser.add_argument("--per-tick", type=int, default=3, help="new submissions per simulated hour")
+    parser.add_argument("--history", type=int, default=1000, help="submissions already synced at start")
+    parser.add_argument("--warmup", type=int, default=12, help="samples ignored while caches fill")
+    parser.add_argument("--output", help="write every sample to this JSON file")
+    args = parser.parse_args(argv)
+
+    tracemalloc.start()
+    workdir = tempfile.mkdtemp(prefix="cf-soak-")
+    problemset = generate_problemset()
+    start = datetime.datetime.now().replace(minute=0, second=0, microsecond=0)
+    history = generate_history(args.history, handle=HANDLE, user_rating=RATING,
+                               end_time=int(start.timestamp()), problemset=problemset)
+
+    samples = []
+    try:
+        with MockCodeforcesAPI(histories={HANDLE: history}, problemset=problemset) as api:
+            tracker = make_tracker(os.path.join(workdir, "soak.db"), api.url, HANDLE, RATING,
+                                   keep_schedule=True)
+            tracker.sync_with_codeforces(full_history=True)
+            snapshot = None
+
+            for tick in range(args.days * args.ticks_per_day):
+                when = start + datetime.timedelta(hours=24 / args.ticks_per_day * (tick + 1))
+                windows = simulate_hour(tracker, api, when, problemset, args.per_tick, seed=tick + 1)
+                samples.append(dict(sample(tracker, windows), tick=tick))
+                if tick + 1 == args.warmup:
+                    snapshot = tracemalloc.take_snapshot()
+                if (tick + 1) % args.ticks_per_day == 0:
+                    s = samples[-1]
+                    print(f"day {(tick + 1) // args.ticks_per_day:>3}: rss {s['rss_mb']:.1f} MB, "
+                          f"traced {s['traced_mb']:.1f} MB, figures {s['figures']}, "
+                          f"after {s['after_callbacks']}, windows {s['windows']}, db {s['db_kb']:.0f} KB")
+
+            top_allocators = []
+            if snapshot is not None:
+                top_allocators = tracemalloc.take_snapshot().compare_to(snapshot, "lineno")[:10]
+            close_tracker(tracker)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(samples, f, indent=2)
+
+    if top_allocators:
+        print("\nTop allocators since warm-up:")
+        for stat in top_allocators:
+            print(f"  {stat}")
+
+    if len(samples) <= args.warmup:
+        print("\nNot enough samples after warm-up to check growth.")
+        return 1
+
+    print(f"\n{'metric':<20}{'first':>12}{'last':>12}{'growth':>12}{'limit':>10}")
+    failed = False
+    for metric, first, last, growth, limit, ok in check_growth(samples, args.warmup):
+        failed |= not ok
+        print(f"{metric:<20}{first:>12.2f}{last:>12.2f}{growth:>12.2f}{limit:>10}{'' if ok else '  LEAK'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Generate realistic synthetic Codeforces data for benchmarks."""
+import random
+import time
+
+TAGS = [
+    "implementation", "math", "greedy", "dp", "data structures", "brute force",
+    "constructive algorithms", "graphs", "sortings", "binary search", "dfs and similar",
+    "trees", "strings", "number theory", "combinatorics", "two pointers", "bitmasks",
+    "geometry", "dsu", "shortest paths", "probabilities", "interactive", "games",
+]
+
+VERDICTS = [
+    ("OK", 0.45),
+    ("WRONG_ANSWER", 0.30),
+    ("TIME_LIMIT_EXCEEDED", 0.12),
+    ("RUNTIME_ERROR", 0.06),
+    ("MEMORY_LIMIT_EXCEEDED", 0.02),
+    ("COMPILATION_ERROR", 0.05),
+]
+
+LANGUAGES = ["GNU C++17", "GNU C++20 (64)", "Python 3", "PyPy 3-64", "Java 21"]
+
+
+def generate_problemset(contests=2000, seed=0):
+    """
+    Generate a problemset.problems style list of problems.
+
+    Args:
+        contests (int): number of contests, each with 5-8 problems
+        seed (int): random seed
+
+    Returns:
+        list: problem dicts as returned by the Codeforces API
+    """
+    rng = random.Random(seed)
+    problems = []
+    for contest_id in range(contests, 0, -1):
+        size = rng.randint(5, 8)
+        for position in range(size):
+            index = chr(ord("A") + position)
+            problem = {
+                "contestId": contest_id,
+                "index": index,
+                "name": f"Problem {contest_id}{index}",
+                "type": "PROGRAMMING",
+                "tags": rng.sample(TAGS, rng.randint(1, 4)),
+            }
+            # Recent contests are not rated yet, and later problems are harder
+            if contest_id < contests - 5:
+                rating = 800 + position * 300 + rng.choice([-200, -100, 0, 100, 200])
+                problem["rating"] = max(800, min(3500, rating))
+            problems.append(problem)
+    return problems
+
+
+def generate_history(count, handle="tourist", user_rating=1600, end_time=None, days=None,
+                     problemset=None, seed=0):
+    """
+    Generate a user.status style submission history, newest first.
+
+    Submissions fall on a random subset of active days, pick problems around
+    the user's rating and repeat attempts on a problem before the accepted one.
+
+    Args:
+        count (int): number of submissions
+        handle (str): author handle
+        user_rating (int): centre of the problem rating distribution
+        end_time (int): timestamp of the newest submission (defaults to now)
+        days (int): number of days the history spans (defaults to count / 10, 90 to 1095)
+        problemset (list): problems to pick from (defaults to generate_problemset())
+        seed (int): random seed
+
+    Returns:
+        list: submission dicts as returned by the Codeforces API
+    """
+    rng = random.Random(seed)
+    if end_time is None:
+        end_time = int(time.time())
+    if days is None:
+        days = max(90, min(3 * 365, count // 10))
+    if problemset is None:
+        problemset = generate_problemset(seed=seed)
+
+    by_rating = {}
+    unrated = []
+    for problem in problemset:
+        if "rating" in problem:
+            by_rating.setdefault(problem["rating"], []).append(problem)
+        else:
+            unrated.append(problem)
+    ratings = sorted(by_rating)
+
+    def pick_problem():
+        if unrated and rng.random() < 0.05:
+            return rng.choice(unrated)
+        target = rng.gauss(user_rating, 250)
+        rating = min(ratings, key=lambda r: abs(r - target))
+        return rng.choice(by_rating[rating])
+
+    # Spread submission times over the active days, newest first
+    active_days = rng.sample(range(days), max(1, int(days * 0.6)))
+    timestamps = sorted(
+        (end_time - day * 86400 - rng.randint(0, 86399) for day in rng.choices(active_days, k=count)),
+        reverse=True,
+    )
+    timestamps[0] = end_time
+
+    submissions = []
+    submission_id = 10 ** 9
+    verdicts, weights = zip(*VERDICTS)
+    while len(submissions) < count:
+        problem = pick_problem()
+        attempts = 1 + int(rng.expovariate(1.0))
+        for attempt in range(attempts):
+            if len(submissions) >= count:
+                break
+            timestamp = timestamps[len(submissions)]
+            # The newest attempt in the list is the last one made, so it gets the AC chance
+            verdict = rng.choices(verdicts, weights)[0] if attempt == 0 else rng.choice(verdicts[1:])
+            submissions.append({
+                "id": submission_id,
+                "contestId": problem["contestId"],
+                "creationTimeSeconds": timestamp,
+                "relativeTimeSeconds": 2147483647,
+                "problem": problem,
+                "author": {
+                    "contestId": problem["contestId"],
+                    "members": [{"handle": handle}],
+                    "participantType": "PRACTICE",
+                    "ghost": False,
+                    "startTimeSeconds": timestamp,
+                },
+                "programmingLanguage": rng.choice(LANGUAGES),
+                "verdict": verdict,
+                "testset": "TESTS",
+                "passedTestCount": rng.randint(0, 60),
+                "timeConsumedMillis": rng.randint(15, 2000),
+                "memoryConsumedBytes": rng.randint(0, 256) * 1024 * 1024,
+            })
+            submission_id -= rng.randint(1, 50)
+    return submissions
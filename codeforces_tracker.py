@@ -13,9 +13,183 @@ import time
 logging.basicConfig(filename="tracker.log", level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
+class ProblemRecommender:
+    """Suggest unsolved problems whose ppd fits the remaining daily score budget."""
+
+    SCORE_STEP = 0.01  # Score resolution used when searching for combinations
+
+    def __init__(self, problemset, solved, base, exp):
+        """
+        Build the rating and tag indexes once so queries never scan the problemset.
+
+        Args:
+            problemset (list): (problem_id, rating, tags) rows from the local cache
+            solved (iterable): problem ids that are already solved
+            base (float): scoring base (your rating + 100)
+            exp (float): scoring exponent (1 + your rating / 2000)
+        """
+        self.base = base
+        self.exp = exp
+        self.solved = set(solved)
+
+        # Count solves per tag; the fewer solves a tag has, the weaker it is
+        tags_by_problem = {problem_id: tags for problem_id, _, tags in problemset}
+        self.tag_solves = {}
+        for _, _, tags in problemset:
+            for tag in tags:
+                self.tag_solves.setdefault(tag, 0)
+        for problem_id in self.solved:
+            for tag in tags_by_problem.get(problem_id, ()):
+                self.tag_solves[tag] += 1
+
+        # Bucket unsolved problems by rating (and by tag, then rating),
+        # each bucket pre-sorted so the weakest-tag problems come first
+        self.by_rating = {}
+        self.by_tag = {}
+        self.unsolved = {}  # problem_id -> (rating, tags)
+        for problem_id, rating, tags in problemset:
+            if problem_id in self.solved:
+                continue
+            self.unsolved[problem_id] = (rating, tags)
+            entry = (self.weakness(tags), problem_id, rating, tags)
+            self.by_rating.setdefault(rating, []).append(entry)
+            for tag in tags:
+                self.by_tag.setdefault(tag, {}).setdefault(rating, []).append(entry)
+        for bucket in self.by_rating.values():
+            bucket.sort(key=lambda e: (-e[0], e[1]))
+        for buckets in self.by_tag.values():
+            for bucket in buckets.values():
+                bucket.sort(key=lambda e: (-e[0], e[1]))
+
+        # Unsolved counts per bucket, kept in step with mark_solved
+        self.available = {rating: len(bucket) for rating, bucket in self.by_rating.items()}
+        self.tag_available = {
+            tag: {rating: len(bucket) for rating, bucket in buckets.items()}
+            for tag, buckets in self.by_tag.items()
+        }
+
+    def weakness(self, tags):
+        """Weight of a problem's weakest tag, 1.0 for a tag you have never solved."""
+        if not tags:
+            return 0
+        return max(1 / (1 + self.tag_solves.get(tag, 0)) for tag in tags)
+
+    def score(self, rating):
+        """Score contribution of a single problem of the given rating."""
+        return (rating / self.base) ** self.exp
+
+    def mark_solved(self, problem_id):
+        """Exclude a newly solved problem from future suggestions."""
+        if problem_id in self.unsolved:
+            rating, tags = self.unsolved.pop(problem_id)
+            self.available[rating] -= 1
+            for tag in tags:
+                self.tag_available[tag][rating] -= 1
+        self.solved.add(problem_id)
+
+    def recommend(self, budget, count=3, tag=None):
+        """
+        Pick up to `count` unsolved problems whose scores together come closest to `budget`.
+
+        Args:
+            budget (float): score still needed today
+            count (int): number of problems to suggest
+            tag (str): restrict suggestions to this tag (optional)
+
+        Returns:
+            list: (problem_id, rating, score, tags) tuples, easiest first
+        """
+        buckets = self.by_tag.get(tag, {}) if tag else self.by_rating
+        available = self.tag_available.get(tag, {}) if tag else self.available
+        ratings = sorted(r for r in buckets if available[r] > 0)
+        if budget <= 0 or count <= 0 or not ratings:
+            return []
+
+        scores = [self.score(r) for r in ratings]
+        limits = [available[r] for r in ratings]
+        combo = self._best_combo(scores, limits, count, budget)
+
+        # Take the weakest-tag unsolved problems from each chosen bucket
+        picks = []
+        for i, repeat in enumerate(combo):
+            if not repeat:
+                continue
+            for _, problem_id, rating, tags in buckets[ratings[i]]:
+                if problem_id not in self.solved:
+                    picks.append((problem_id, rating, scores[i], tags))
+                    repeat -= 1
+                    if not repeat:
+                        break
+        return picks
+
+    def _best_combo(self, scores, limits, count, target):
+        """
+        Choose how many problems to take from each bucket so that `count` problems
+        (or as many as exist) have scores summing closest to `target`.
+
+        Scores are quantised to SCORE_STEP and solved as a bounded knapsack over the
+        rating buckets, with reachable sums for each item count kept as int bitsets.
+
+        Returns:
+            list: number of problems to take from each bucket
+        """
+        count = min(count, sum(limits))
+        values = [max(1, round(score / self.SCORE_STEP)) for score in scores]
+        goal = round(target / self.SCORE_STEP)
+
+        # layers[i][k] has bit s set if k problems from the first i buckets can sum to s
+        layers = [[1] + [0] * count]
+        for value, limit in zip(values, limits):
+            previous = layers[-1]
+            current = previous[:]
+            for k in range(1, count + 1):
+                for repeat in range(1, min(limit, k) + 1):
+                    current[k] |= previous[k - repeat] << (repeat * value)
+            layers.append(current)
+
+        # Closest reachable total, preferring the lower one on ties
+        reachable = layers[-1][count]
+        below = reachable & ((1 << (goal + 1)) - 1)  # Totals <= goal
+        above = reachable >> goal  # Totals >= goal, shifted down by goal
+        candidates = []
+        if below:
+            candidates.append(below.bit_length() - 1)
+        if above:
+            candidates.append(goal + (above & -above).bit_length() - 1)
+        best = min(candidates, key=lambda total: (abs(total - goal), total))
+
+        # Walk back through the layers to recover the counts per bucket
+        combo = [0] * len(values)
+        k, total = count, best
+        for i in range(len(values), 0, -1):
+            value, previous = values[i - 1], layers[i - 1]
+            for repeat in range(0, min(limits[i - 1], k) + 1):
+                rest = total - repeat * value
+                if rest >= 0 and previous[k - repeat] >> rest & 1:
+                    combo[i - 1] = repeat
+                    k, total = k - repeat, rest
+                    break
+        return combo
+
+
 class CodeforcesTracker:
-    def __init__(self, root):
+    API_BASE = "https://codeforces.com/api"
+    API_DELAY = 0.5  # Seconds between paginated API requests
+    HEATMAP_CELL = 12  # Heatmap cell size in pixels, including the gap
+    HEATMAP_GAP = 2
+    HEATMAP_WEEKS = 53  # Weeks per heatmap row before wrapping
+    SYNC_INTERVAL_MS = 600000  # Regular sync every 10 minutes
+    SYNC_RETRY_MS = 120000  # Retry a failed sync after 2 minutes
+    CONTEST_POLL_MS = 5000  # contest.status poll cadence in contest mode
+    CONTEST_POLL_COUNT = 10  # Latest submissions fetched per contest poll
+    API_MIN_INTERVAL_MS = 2000  # Codeforces allows one API call per 2 seconds
+    CONTEST_MAX_BACKOFF_MS = 60000
+    RECORDS_PAGE = 500  # Records loaded into Manage Records at a time
+    PROBLEMSET_MAX_AGE = 86400  # Refresh the cached problemset once a day
+
+    def __init__(self, root, db_path="codeforces_tracker.db"):
         self.root = root
+        self.db_path = db_path
         self.root.title("Codeforces Progress Tracker")
         self.root.geometry("600x400")
         self.root.attributes('-topmost', True)  # Always on top
@@ -37,7 +211,7 @@ class CodeforcesTracker:
         self.style.configure("TFrame", background=self.colors["bg_dark"])
         
         # Database setup
-        self.conn = sqlite3.connect("codeforces_tracker.db")
+        self.conn = sqlite3.connect(self.db_path)
         self.cursor = self.conn.cursor()
         self.create_table()
 
@@ -48,6 +222,13 @@ class CodeforcesTracker:
         self.base = self.user_rating + 100  # base = rating + 100
         self.exp = 1 + (self.user_rating / 2000)  # exponent = 1 + rating/2000
         self.today_score = self.get_today_score()
+        self.recommender = None  # Built lazily from the cached problemset
+        self.sync_job = None  # Pending root.after id for the next regular sync
+        self.syncing = False
+        self.sync_pending = None  # full_history flag of a sync dropped while another ran
+        self.records_window = None  # The open Manage Records window, if any
+        self.reload_records = None  # Reloads that window's list
+        self.contest = None  # Live contest state while contest mode is on
         
         # Last checked submission time
         self.last_submission_time = self.get_last_submission_time()
@@ -73,6 +254,13 @@ class CodeforcesTracker:
         self.cursor.execute('''CREATE TABLE IF NOT EXISTS sync_info (
                                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                                 last_submission_time INTEGER)''')
+        self.cursor.execute('''CREATE TABLE IF NOT EXISTS problemset (
+                                problem_id TEXT PRIMARY KEY,
+                                rating INTEGER,
+                                tags TEXT)''')
+        self.cursor.execute('''CREATE TABLE IF NOT EXISTS problemset_info (
+                                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                fetched_time INTEGER)''')
 
         # Check if problem_id column exists, add it if it doesn't
         try:
@@ -90,6 +278,9 @@ class CodeforcesTracker:
             self.cursor.execute("ALTER TABLE problems ADD COLUMN submission_id INTEGER")
             logging.info("Added missing submission_id column to problems table")
 
+        # Covering index for date range scans (charts, heatmap, today's score)
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_problems_date_rating ON problems (date, rating)")
+
         self.conn.commit()
 
     def get_user_handle(self):
@@ -150,6 +341,8 @@ class CodeforcesTracker:
 
     def update_last_submission_time(self, timestamp):
         """Update the timestamp of the last checked submission."""
+        # Only the latest row is ever read, so don't let the table grow with every sync
+        self.cursor.execute("DELETE FROM sync_info")
         self.cursor.execute("INSERT INTO sync_info (last_submission_time) VALUES (?)", (timestamp,))
         self.conn.commit()
         self.last_submission_time = timestamp
@@ -163,6 +356,7 @@ class CodeforcesTracker:
             self.user_rating = new_rating
             self.base = self.user_rating + 100
             self.exp = 1 + (self.user_rating / 2000)
+            self.recommender = None  # Scores depend on base/exp, rebuild on next use
             messagebox.showinfo("Success", "Rating updated successfully.")
         else:
             messagebox.showerror("Error", "Please enter a valid rating between 0 and 4000.")
@@ -253,8 +447,24 @@ class CodeforcesTracker:
                                   bg=self.colors["bg_medium"], fg=self.colors["text_light"])
         self.help_button.pack(side=tk.LEFT, padx=5)
 
+        # Frame for extra tools
+        tools_frame = tk.Frame(self.root, bg=self.colors["bg_dark"])
+        tools_frame.pack(pady=5)
+
+        self.heatmap_button = tk.Button(tools_frame, text="Show Heatmap", command=self.show_heatmap,
+                                      bg=self.colors["bg_medium"], fg=self.colors["text_light"])
+        self.heatmap_button.pack(side=tk.LEFT, padx=5)
+
+        self.recommend_button = tk.Button(tools_frame, text="Recommend", command=self.recommend_problems,
+                                        bg=self.colors["bg_medium"], fg=self.colors["text_light"])
+        self.recommend_button.pack(side=tk.LEFT, padx=5)
+
+        self.contest_button = tk.Button(tools_frame, text="Contest Mode", command=self.toggle_contest_mode,
+                                      bg=self.colors["bg_medium"], fg=self.colors["text_light"])
+        self.contest_button.pack(side=tk.LEFT, padx=5)
+
         # Auto-sync on startup - just recent submissions
-        self.root.after(1000, self.sync_with_codeforces)
+        self.schedule_sync(1000)
 
         # Ask if user wants to sync full history on first run
         self.check_first_run()
@@ -304,6 +514,8 @@ class CodeforcesTracker:
                 (date, rating, problem_id, submission_id)
             )
             self.conn.commit()
+            if problem_id and self.recommender:
+                self.recommender.mark_solved(problem_id)
             self.update_today_score()
             if not problem_id:  # Only clear entry field for manual entries
                 self.rating_entry.delete(0, tk.END)
@@ -325,6 +537,14 @@ class CodeforcesTracker:
         """Update the progress bar based on today's score."""
         self.progress["value"] = (self.today_score / 2) * 100
 
+    def schedule_sync(self, delay_ms):
+        """Schedule the next regular sync, replacing any sync already scheduled."""
+        if self.sync_job is not None:
+            self.root.after_cancel(self.sync_job)
+            self.sync_job = None
+        if self.contest is None:  # Contest mode resumes regular syncs when it ends
+            self.sync_job = self.root.after(delay_ms, self.sync_with_codeforces)
+
     def sync_with_codeforces(self, full_history=False):
         """
         Sync with Codeforces API to get submissions.
@@ -332,6 +552,13 @@ class CodeforcesTracker:
         Args:
             full_history (bool): If True, fetches all historical submissions regardless of last sync time
         """
+        # root.update() below can run a scheduled sync or a button press; don't nest
+        # syncs, but remember the dropped one (a full sync wins) to run afterwards
+        if self.syncing:
+            self.sync_pending = bool(self.sync_pending) or full_history
+            return
+        self.syncing = True
+
         try:
             # Update UI to show sync in progress
             self.sync_status.config(text="Syncing with Codeforces...")
@@ -349,7 +576,7 @@ class CodeforcesTracker:
             while more_submissions:
                 # Get user submissions from Codeforces API
                 response = requests.get(
-                    f"https://codeforces.com/api/user.status?handle={self.user_handle}&from={from_index}&count={batch_size}"
+                    f"{self.API_BASE}/user.status?handle={self.user_handle}&from={from_index}&count={batch_size}"
                 )
                 
                 if response.status_code != 200:
@@ -411,7 +638,7 @@ class CodeforcesTracker:
                 self.root.update()
                 
                 # Add a small delay to avoid rate limiting
-                time.sleep(0.5)
+                time.sleep(self.API_DELAY)
             
             # Update last submission time
             if latest_submission_time > self.last_submission_time:
@@ -424,7 +651,7 @@ class CodeforcesTracker:
             
             # Schedule next sync (every 10 minutes) - but only for incremental syncs
             if not full_history:
-                self.root.after(600000, self.sync_with_codeforces)
+                self.schedule_sync(self.SYNC_INTERVAL_MS)
                 
         except requests.exceptions.RequestException as e:
             messagebox.showerror("Network Error", f"Failed to connect to Codeforces API: {e}")
@@ -432,38 +659,191 @@ class CodeforcesTracker:
             logging.error(f"Network error during sync: {e}")
             # Try again in 2 minutes if there was an error
             if not full_history:
-                self.root.after(120000, self.sync_with_codeforces)
+                self.schedule_sync(self.SYNC_RETRY_MS)
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred during sync: {e}")
             self.sync_status.config(text=f"Last sync failed: {datetime.datetime.now().strftime('%H:%M:%S')}")
             logging.error(f"Error during sync: {e}")
             # Try again in 2 minutes if there was an error
             if not full_history:
-                self.root.after(120000, self.sync_with_codeforces)
+                self.schedule_sync(self.SYNC_RETRY_MS)
+        finally:
+            self.syncing = False
+            if self.sync_pending is not None:
+                pending_full_history, self.sync_pending = self.sync_pending, None
+                self.root.after_idle(lambda: self.sync_with_codeforces(full_history=pending_full_history))
+
+    def toggle_contest_mode(self):
+        """Start contest mode for a contest id, or stop it if it is running."""
+        if self.contest is not None:
+            self.stop_contest_mode()
+            return
+        contest_id = simpledialog.askinteger("Contest Mode", "Enter the contest id:", minvalue=1)
+        if contest_id:
+            self.start_contest_mode(contest_id)
+
+    def start_contest_mode(self, contest_id):
+        """
+        Poll contest.status for a running contest instead of waiting for the regular sync.
 
-    def show_graph(self):
-        """Display a graph of progress over the last 30 days."""
-        # Calculate date range for the last 30 days
-        end_date = self.today
-        start_date = end_date - datetime.timedelta(days=29)
-        
-        # Generate a complete list of dates for the last 30 days
+        Args:
+            contest_id (int): Codeforces contest id
+        """
+        try:
+            response = requests.get(
+                f"{self.API_BASE}/contest.standings?contestId={contest_id}&from=1&count=1", timeout=10
+            )
+            data = response.json()
+            if response.status_code != 200 or data["status"] != "OK":
+                messagebox.showerror("API Error", f"Failed to fetch contest: {data.get('comment', response.status_code)}")
+                return
+            contest = data["result"]["contest"]
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            messagebox.showerror("Network Error", f"Failed to connect to Codeforces API: {e}")
+            logging.error(f"Failed to start contest mode: {e}")
+            return
+
+        start_time, duration = contest.get("startTimeSeconds"), contest.get("durationSeconds")
+        if contest.get("phase") not in ("BEFORE", "CODING") or start_time is None or duration is None:
+            messagebox.showinfo("Contest Mode", f"Contest {contest_id} is not running.")
+            return
+
+        self.contest = {
+            "id": contest_id,
+            "name": contest.get("name", str(contest_id)),
+            "end_time": start_time + duration,
+            "seen": set(),  # Submission ids with a final verdict
+            "interval": self.CONTEST_POLL_MS,
+            "job": None,
+        }
+        # Regular syncs pause while the contest is polled
+        self.schedule_sync(self.SYNC_INTERVAL_MS)
+        self.contest_button.config(text="Stop Contest Mode")
+        logging.info(f"Contest mode started for contest {contest_id}")
+        self.contest["job"] = self.root.after(self.API_MIN_INTERVAL_MS, self.poll_contest)
+
+    def stop_contest_mode(self):
+        """Stop polling the contest and resume regular syncs straight away."""
+        if self.contest is None:
+            return
+        if self.contest["job"] is not None:
+            self.root.after_cancel(self.contest["job"])
+        logging.info(f"Contest mode stopped for contest {self.contest['id']}")
+        self.contest = None
+        self.contest_button.config(text="Contest Mode")
+        self.sync_with_codeforces()
+
+    def poll_contest(self):
+        """Fetch the latest contest submissions and score any new accepted ones."""
+        contest = self.contest
+        if contest is None:
+            return
+        # A direct call must not leave the scheduled poll running as a second chain
+        if contest["job"] is not None:
+            self.root.after_cancel(contest["job"])
+            contest["job"] = None
+
+        if time.time() >= contest["end_time"]:
+            self.sync_status.config(text=f"Contest {contest['id']} ended - back to regular sync")
+            self.stop_contest_mode()
+            return
+
+        try:
+            response = requests.get(
+                f"{self.API_BASE}/contest.status?contestId={contest['id']}&handle={self.user_handle}"
+                f"&from=1&count={self.CONTEST_POLL_COUNT}",
+                timeout=10
+            )
+            data = response.json()
+            if response.status_code != 200 or data["status"] != "OK":
+                raise ValueError(data.get("comment", f"status {response.status_code}"))
+
+            for submission in data["result"]:
+                verdict = submission.get("verdict")
+                if submission["id"] in contest["seen"] or verdict in (None, "TESTING"):
+                    continue  # Already handled, or still being judged
+                contest["seen"].add(submission["id"])
+                if verdict != "OK":
+                    continue
+
+                problem = submission["problem"]
+                problem_id = f"{problem['contestId']}{problem['index']}"
+                rating = problem.get("rating")
+                if rating is None:
+                    # Live contest problems are unrated until after the contest
+                    rating = simpledialog.askinteger(
+                        "Problem Rating", f"{problem_id} has no rating yet. Enter your estimate:",
+                        initialvalue=self.user_rating, minvalue=800, maxvalue=3500
+                    )
+                    if rating is None:
+                        continue
+                submission_date = datetime.datetime.fromtimestamp(submission["creationTimeSeconds"]).date()
+                self.add_problem(
+                    date=str(submission_date),
+                    rating=rating,
+                    problem_id=problem_id,
+                    submission_id=submission["id"]
+                )
+
+            contest["interval"] = self.CONTEST_POLL_MS
+            self.sync_status.config(
+                text=f"Contest {contest['id']}: live - last poll {datetime.datetime.now().strftime('%H:%M:%S')}"
+            )
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            # Back off (e.g. on "Call limit exceeded") without interrupting with dialogs
+            contest["interval"] = min(contest["interval"] * 2, self.CONTEST_MAX_BACKOFF_MS)
+            self.sync_status.config(text=f"Contest poll failed: {datetime.datetime.now().strftime('%H:%M:%S')}")
+            logging.error(f"Error during contest poll: {e}")
+
+        # Contest mode may have been stopped from a dialog shown during this poll
+        if self.contest is contest:
+            delay = max(contest["interval"], self.API_MIN_INTERVAL_MS)
+            contest["job"] = self.root.after(delay, self.poll_contest)
+
+    def get_daily_scores(self, start_date, end_date):
+        """
+        Calculate the score for every date in a range.
+
+        Args:
+            start_date (datetime.date): first date of the range
+            end_date (datetime.date): last date of the range (inclusive)
+
+        Returns:
+            dict: date string -> score, with zero for days without solves
+        """
+        # Generate a complete list of dates in the range
         date_list = []
         current_date = start_date
         while current_date <= end_date:
             date_list.append(str(current_date))
             current_date += datetime.timedelta(days=1)
         
-        # Get actual problem data
-        self.cursor.execute("SELECT date, rating FROM problems WHERE date BETWEEN ? AND ? ORDER BY date", 
+        # Score each distinct rating once in Python, then let SQLite sum those scores
+        # per date so only one row per day comes back
+        self.cursor.execute("SELECT DISTINCT rating FROM problems WHERE date BETWEEN ? AND ? AND rating IS NOT NULL",
                           (str(start_date), str(end_date)))
-        data = self.cursor.fetchall()
+        ratings = [rating for (rating,) in self.cursor.fetchall()]
         
         # Calculate scores for each date
         score_dict = {date: 0 for date in date_list}  # Initialize all dates with zero score
-        for date, rating in data:
+        if not ratings:
+            return score_dict
+        cases = " ".join(["WHEN ? THEN ?"] * len(ratings))
+        params = [value for rating in ratings for value in (rating, (rating / self.base) ** self.exp)]
+        self.cursor.execute(f"""SELECT date, SUM(CASE rating {cases} ELSE 0 END) FROM problems
+                               WHERE date BETWEEN ? AND ? GROUP BY date""",
+                          params + [str(start_date), str(end_date)])
+        for date, score in self.cursor.fetchall():
             # Add to existing score for this date
-            score_dict[date] = score_dict.get(date, 0) + (rating / self.base) ** self.exp
+            score_dict[date] = score_dict.get(date, 0) + score
+        return score_dict
+
+    def show_graph(self):
+        """Display a graph of progress over the last 30 days."""
+        # Calculate date range for the last 30 days
+        end_date = self.today
+        start_date = end_date - datetime.timedelta(days=29)
+        score_dict = self.get_daily_scores(start_date, end_date)
         
         # Prepare data for plotting
         dates = list(score_dict.keys())
@@ -505,9 +885,274 @@ class CodeforcesTracker:
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         canvas.draw()
 
+        # pyplot keeps every figure alive until it is closed explicitly
+        top.bind("<Destroy>", lambda event: plt.close(fig) if event.widget is top else None)
+
+    def get_heatmap_start(self, years=1):
+        """Return the Sunday the heatmap grid starts on when covering `years` years."""
+        start_date = self.today - datetime.timedelta(days=365 * years - 1)
+        return start_date - datetime.timedelta(days=(start_date.weekday() + 1) % 7)
+
+    def get_heatmap_grid(self, years=1, scores=None):
+        """
+        Arrange daily scores into a week x weekday grid, GitHub style.
+
+        Args:
+            years (int): number of years ending today to cover
+            scores (dict): get_daily_scores() output covering at least this range,
+                           to reuse between redraws (optional)
+
+        Returns:
+            tuple: (first_date, grid) where first_date is a Sunday and grid[week][weekday]
+                   is that day's score, or None for days after today
+        """
+        end_date = self.today
+        first_date = self.get_heatmap_start(years)
+        if scores is None:
+            scores = self.get_daily_scores(first_date, end_date)
+
+        days = (end_date - first_date).days + 1
+        values = [
+            scores.get(str(first_date + datetime.timedelta(days=offset)), 0) for offset in range(days)
+        ] + [None] * (-days % 7)  # Pad the last week with future days
+
+        # Manual entries may be stored unpadded (e.g. 2026-1-5); only those need parsing
+        for date_str, score in scores.items():
+            if len(date_str) == 10:
+                continue
+            try:
+                offset = (datetime.datetime.strptime(date_str, "%Y-%m-%d").date() - first_date).days
+            except ValueError:
+                continue
+            if 0 <= offset < days:
+                values[offset] += score
+
+        grid = [values[i:i + 7] for i in range(0, len(values), 7)]
+        return first_date, grid
+
+    def heatmap_color(self, score):
+        """Map a daily score to a heatmap cell color; a full day is a score of 2."""
+        if score <= 0:
+            return self.colors["bg_medium"]
+        if score < 0.5:
+            return "#4C566A"
+        if score < 1:
+            return self.colors["highlight"]
+        if score < 2:
+            return "#81A1C1"
+        return self.colors["accent"]
+
+    def render_heatmap(self, photo, grid):
+        """
+        Draw a heatmap grid into a single PhotoImage, one filled rectangle per day.
+
+        Weeks wrap into bands of HEATMAP_WEEKS columns, stacked top to bottom.
+        Unfilled pixels stay transparent and show the window background.
+        """
+        cell, gap, weeks = self.HEATMAP_CELL, self.HEATMAP_GAP, self.HEATMAP_WEEKS
+        band_height = 7 * cell + gap
+        bands = (len(grid) + weeks - 1) // weeks
+
+        photo.blank()
+        photo.config(width=weeks * cell, height=bands * band_height)
+        for week, column in enumerate(grid):
+            band, x = divmod(week, weeks)
+            x *= cell
+            for weekday, score in enumerate(column):
+                if score is None:
+                    continue
+                y = band * band_height + weekday * cell
+                photo.put(self.heatmap_color(score), to=(x, y, x + cell - gap, y + cell - gap))
+
+    def show_heatmap(self):
+        """Display a contribution heatmap covering one or more years."""
+        top = tk.Toplevel(self.root)
+        top.title("Progress Heatmap")
+        top.configure(bg=self.colors["bg_dark"])
+
+        control_frame = tk.Frame(top, bg=self.colors["bg_dark"])
+        control_frame.pack(pady=10)
+        tk.Label(control_frame, text="Years:", bg=self.colors["bg_dark"], fg=self.colors["text_light"]).pack(side=tk.LEFT)
+        years_var = tk.IntVar(value=1)
+        years_spinbox = tk.Spinbox(control_frame, from_=1, to=10, width=4, textvariable=years_var,
+                                   bg=self.colors["bg_medium"], fg=self.colors["text_light"])
+        years_spinbox.pack(side=tk.LEFT, padx=5)
+
+        photo = tk.PhotoImage(master=top)
+        image_label = tk.Label(top, image=photo, bg=self.colors["bg_dark"],
+                               borderwidth=0, highlightthickness=0, padx=0, pady=0)
+        image_label.image = photo  # Keep a reference so Tk doesn't drop the image
+        image_label.pack(padx=10)
+
+        tooltip = tk.Label(top, text="Hover over a day", bg=self.colors["bg_dark"], fg=self.colors["text_light"])
+        tooltip.pack(pady=10)
+
+        # Daily scores are cached for the widest range shown so far, keyed on today's
+        # date and score so new solves (which change today's score) refresh them
+        state = {"first_date": self.today, "grid": [], "scores": None, "scores_from": None, "scores_key": None}
+
+        def redraw():
+            try:
+                years = max(1, min(10, years_var.get()))
+            except tk.TclError:
+                return
+            start = time.perf_counter()
+            first_date = self.get_heatmap_start(years)
+            key = (self.today, self.today_score)
+            if state["scores"] is None or state["scores_key"] != key or state["scores_from"] > first_date:
+                state["scores"] = self.get_daily_scores(first_date, self.today)
+                state["scores_from"], state["scores_key"] = first_date, key
+            state["first_date"], state["grid"] = self.get_heatmap_grid(years, state["scores"])
+            self.render_heatmap(photo, state["grid"])
+            logging.info(f"Rendered {years}-year heatmap in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        def on_motion(event):
+            # Resolve the hovered cell from pixel coordinates alone
+            cell, weeks = self.HEATMAP_CELL, self.HEATMAP_WEEKS
+            band_height = 7 * cell + self.HEATMAP_GAP
+            band, y = divmod(event.y, band_height)
+            weekday, column = y // cell, event.x // cell
+            week = band * weeks + column
+            if event.x < 0 or column >= weeks or weekday >= 7 or week >= len(state["grid"]):
+                return
+            score = state["grid"][week][weekday]
+            if score is None:
+                return
+            date = state["first_date"] + datetime.timedelta(days=week * 7 + weekday)
+            tooltip.config(text=f"{date.strftime('%a %Y-%m-%d')}: score {score:.2f}")
+
+        image_label.bind("<Motion>", on_motion)
+        years_spinbox.config(command=redraw)
+        years_spinbox.bind("<Return>", lambda event: redraw())
+        redraw()
+
+    def load_problemset(self, force=False):
+        """
+        Return the locally cached problemset, refreshing it from Codeforces once a day.
+
+        Args:
+            force (bool): If True, refetches the problemset regardless of cache age
+        """
+        stale = int(time.time()) - self.get_problemset_fetched_time() > self.PROBLEMSET_MAX_AGE
+
+        if force or stale:
+            try:
+                response = requests.get(f"{self.API_BASE}/problemset.problems", timeout=30)
+                data = response.json()
+                if response.status_code != 200 or data["status"] != "OK":
+                    raise ValueError(data.get("comment", f"status {response.status_code}"))
+
+                rows = [
+                    (f"{p['contestId']}{p['index']}", p["rating"], json.dumps(p.get("tags", [])))
+                    for p in data["result"]["problems"]
+                    if "rating" in p and "contestId" in p
+                ]
+                self.cursor.execute("DELETE FROM problemset")
+                self.cursor.executemany(
+                    "INSERT OR REPLACE INTO problemset (problem_id, rating, tags) VALUES (?, ?, ?)", rows
+                )
+                self.cursor.execute("INSERT INTO problemset_info (fetched_time) VALUES (?)", (int(time.time()),))
+                self.conn.commit()
+                self.recommender = None
+                logging.info(f"Cached {len(rows)} problems from problemset")
+            except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+                # Fall back to whatever is cached, if anything
+                logging.error(f"Failed to refresh problemset: {e}")
+
+        self.cursor.execute("SELECT problem_id, rating, tags FROM problemset")
+        return [(problem_id, rating, json.loads(tags)) for problem_id, rating, tags in self.cursor.fetchall()]
+
+    def get_problemset_fetched_time(self):
+        """Return when the problemset cache was last refreshed, or 0 if it never was."""
+        self.cursor.execute("SELECT fetched_time FROM problemset_info ORDER BY id DESC LIMIT 1")
+        result = self.cursor.fetchone()
+        return result[0] if result else 0
+
+    def get_recommender(self):
+        """Return the problem recommender, building its indexes if needed."""
+        recommender = self.recommender
+        if recommender is None or int(time.time()) - recommender.fetched_time > self.PROBLEMSET_MAX_AGE:
+            problemset = self.load_problemset()
+            self.cursor.execute("SELECT DISTINCT problem_id FROM problems WHERE problem_id IS NOT NULL")
+            solved = [row[0] for row in self.cursor.fetchall()]
+            recommender = ProblemRecommender(problemset, solved, self.base, self.exp)
+            recommender.fetched_time = self.get_problemset_fetched_time()
+            # An empty problemset means the fetch failed; try again on the next request
+            self.recommender = recommender if problemset else None
+        return recommender
+
+    def recommend_problems(self):
+        """Suggest unsolved problems that fill the rest of today's target score."""
+        target = simpledialog.askfloat("Recommend", "Target score for today:", initialvalue=2.0, minvalue=0)
+        if target is None:
+            return
+        count = simpledialog.askinteger("Recommend", "Number of problems:", initialvalue=3, minvalue=1, maxvalue=10)
+        if count is None:
+            return
+        tag = simpledialog.askstring("Recommend", "Restrict to tag (optional):")
+
+        budget = target - self.today_score
+        if budget <= 0:
+            messagebox.showinfo("Recommend", f"Today's score {self.today_score:.2f} already reaches {target:.2f}.")
+            return
+
+        recommender = self.get_recommender()
+        if not recommender.by_rating:
+            messagebox.showerror("Error", "No problemset available. Check your connection and try again.")
+            return
+
+        picks = recommender.recommend(budget, count, tag.strip() if tag else None)
+        if not picks:
+            messagebox.showinfo("Recommend", "No unsolved problems match that query.")
+            return
+
+        top = tk.Toplevel(self.root)
+        top.title("Recommended Problems")
+        top.geometry("600x300")
+        top.configure(bg=self.colors["bg_dark"])
+
+        total = sum(score for _, _, score, _ in picks)
+        tk.Label(top, text=f"Remaining budget: {budget:.2f} - Suggested total: {total:.2f}",
+                 bg=self.colors["bg_dark"], fg=self.colors["text_light"]).pack(pady=10)
+
+        listbox = tk.Listbox(top, width=80, height=10, bg=self.colors["bg_medium"],
+                             fg=self.colors["text_light"], selectbackground=self.colors["highlight"])
+        listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        for problem_id, rating, score, tags in picks:
+            listbox.insert(tk.END, f"{problem_id} | Rating: {rating} | ppd: {score:.2f} | {', '.join(tags)}")
+
+    def query_records(self, query=None, limit=None, offset=0):
+        """
+        Fetch problem records, newest first.
+
+        Args:
+            query (str): substring to match against date, rating or problem id (optional)
+            limit (int): maximum number of records to return (optional)
+            offset (int): number of matching records to skip
+        """
+        page = (-1 if limit is None else limit, offset)  # LIMIT -1 means no limit in SQLite
+        if query:
+            self.cursor.execute(
+                """SELECT * FROM problems 
+                   WHERE date LIKE ? OR rating LIKE ? OR problem_id LIKE ? 
+                   ORDER BY date DESC, id DESC LIMIT ? OFFSET ?""",
+                (f"%{query}%", f"%{query}%", f"%{query}%") + page
+            )
+        else:
+            self.cursor.execute("SELECT * FROM problems ORDER BY date DESC, id DESC LIMIT ? OFFSET ?", page)
+        return self.cursor.fetchall()
+
     def manage_records(self):
         """Open a window to manage records."""
+        # Reuse the open window, refreshed so newly synced records show up
+        if self.records_window is not None and self.records_window.winfo_exists():
+            self.reload_records()
+            self.records_window.deiconify()
+            self.records_window.lift()
+            return
+
         top = tk.Toplevel(self.root)
+        self.records_window = top
         top.title("Manage Records")
         top.geometry("700x500")
         top.configure(bg=self.colors["bg_dark"])
@@ -519,26 +1164,12 @@ class CodeforcesTracker:
                                fg=self.colors["text_light"], insertbackground=self.colors["text_light"])
         search_entry.pack(side=tk.LEFT, padx=5)
 
-        def search_records():
-            query = search_entry.get()
-            self.cursor.execute(
-                """SELECT * FROM problems 
-                   WHERE date LIKE ? OR rating LIKE ? OR problem_id LIKE ? 
-                   ORDER BY date DESC, id DESC""",
-                (f"%{query}%", f"%{query}%", f"%{query}%")
-            )
-            records = self.cursor.fetchall()
-            listbox.delete(0, tk.END)
-            for record in records:
-                problem_id = record[3] if record[3] else "N/A"
-                listbox.insert(tk.END, f"{record[0]} | {record[1]} | Rating: {record[2]} | Problem: {problem_id}")
-
-        search_button = tk.Button(search_frame, text="Search", command=search_records,
+        search_button = tk.Button(search_frame, text="Search", command=lambda: load_records(),
                                 bg=self.colors["bg_medium"], fg=self.colors["text_light"])
         search_button.pack(side=tk.LEFT)
 
         clear_button = tk.Button(search_frame, text="Clear", 
-                               command=lambda: (search_entry.delete(0, tk.END), load_all_records()),
+                               command=lambda: (search_entry.delete(0, tk.END), load_records()),
                                bg=self.colors["bg_medium"], fg=self.colors["text_light"])
         clear_button.pack(side=tk.LEFT, padx=5)
 
@@ -561,16 +1192,21 @@ class CodeforcesTracker:
         scrollbar_y.config(command=listbox.yview)
         scrollbar_x.config(command=listbox.xview)
 
-        def load_all_records():
-            self.cursor.execute("SELECT * FROM problems ORDER BY date DESC, id DESC")
-            records = self.cursor.fetchall()
-            listbox.delete(0, tk.END)
-            for record in records:
+        records = []  # Rows shown in the listbox, in the same order
+
+        def load_records(more=False):
+            # Load one page of records matching the search box, or the next page if `more`
+            if not more:
+                records.clear()
+                listbox.delete(0, tk.END)
+            page = self.query_records(search_entry.get(), limit=self.RECORDS_PAGE, offset=len(records))
+            records.extend(page)
+            for record in page:
                 problem_id = record[3] if record[3] else "N/A"
                 listbox.insert(tk.END, f"{record[0]} | {record[1]} | Rating: {record[2]} | Problem: {problem_id}")
-            return records
 
-        records = load_all_records()
+        load_records()
+        self.reload_records = load_records
 
         button_frame = tk.Frame(top, bg=self.colors["bg_dark"])
         button_frame.pack(pady=10)
@@ -617,7 +1253,7 @@ class CodeforcesTracker:
             problem_id = simpledialog.askstring("Insert Record", "Enter problem ID (optional):")
             if date and rating and self.validate_rating(rating) and self.validate_date(date):
                 self.add_problem(date, rating, problem_id)
-                load_all_records()  # Reload all records
+                load_records()  # Reload records
                 logging.info(f"Inserted record: date={date}, rating={rating}, problem_id={problem_id}")
 
         delete_button = tk.Button(button_frame, text="Delete", command=delete_selected)
@@ -629,9 +1265,12 @@ class CodeforcesTracker:
         insert_button = tk.Button(button_frame, text="Insert", command=insert_record)
         insert_button.pack(side=tk.LEFT, padx=5)
         
-        refresh_button = tk.Button(button_frame, text="Refresh", command=lambda: (records.clear(), records.extend(load_all_records())))
+        refresh_button = tk.Button(button_frame, text="Refresh", command=lambda: load_records())
         refresh_button.pack(side=tk.LEFT, padx=5)
 
+        more_button = tk.Button(button_frame, text="Load More", command=lambda: load_records(more=True))
+        more_button.pack(side=tk.LEFT, padx=5)
+
     def reset_database(self):
         """Reset the database after confirmation."""
         confirm = messagebox.askyesno("Confirm Reset", "Are you sure you want to reset the database? This will delete all records.")
@@ -646,7 +1285,7 @@ class CodeforcesTracker:
             messagebox.showinfo("Info", "Database reset successfully. The application will now restart.")
             logging.info("Database reset.")
             self.root.destroy()
-            self.__init__(tk.Tk())
+            self.__init__(tk.Tk(), self.db_path)
             self.run()
 
     def show_help(self):
@@ -0,0 +1,76 @@
+"""Check ProblemRecommender's combination search against brute force."""
+import itertools
+import random
+
+from codeforces_tracker import ProblemRecommender
+
+BASE, EXP = 1700, 1.8
+
+
+def make_problemset(counts, tags=("dp",)):
+    """`counts` maps rating -> number of problems; each problem gets every tag in `tags`."""
+    return [(f"{rating}-{i}", rating, list(tags)) for rating, n in counts.items() for i in range(n)]
+
+
+def brute_force_error(values, limits, count, goal):
+    """Smallest |total - goal| over every way of taking min(count, available) problems."""
+    count = min(count, sum(limits))
+    best = None
+    for combo in itertools.product(*(range(limit + 1) for limit in limits)):
+        if sum(combo) == count:
+            error = abs(sum(v * c for v, c in zip(values, combo)) - goal)
+            best = error if best is None else min(best, error)
+    return best
+
+
+def test_best_combo_matches_brute_force():
+    rng = random.Random(0)
+    recommender = ProblemRecommender([], [], BASE, EXP)
+    for _ in range(500):
+        ratings = sorted(rng.sample(range(800, 3600, 100), rng.randint(1, 6)))
+        scores = [recommender.score(r) for r in ratings]
+        limits = [rng.randint(1, 3) for _ in ratings]
+        count = rng.randint(1, 6)
+        target = rng.uniform(0.1, 8.0)
+
+        combo = recommender._best_combo(scores, limits, count, target)
+
+        values = [max(1, round(score / recommender.SCORE_STEP)) for score in scores]
+        goal = round(target / recommender.SCORE_STEP)
+        assert all(0 <= c <= limit for c, limit in zip(combo, limits))
+        assert sum(combo) == min(count, sum(limits))
+        error = abs(sum(v * c for v, c in zip(values, combo)) - goal)
+        assert error == brute_force_error(values, limits, count, goal)
+
+
+def test_recommend_respects_bucket_sizes():
+    recommender = ProblemRecommender(make_problemset({r: 2 for r in range(800, 3600, 100)}), [], BASE, EXP)
+    picks = recommender.recommend(8.0, 10)
+    assert len(picks) == 10
+    assert len({problem_id for problem_id, _, _, _ in picks}) == 10
+    ratings = [rating for _, rating, _, _ in picks]
+    assert max(ratings.count(r) for r in ratings) <= 2
+
+
+def test_recommend_returns_all_when_count_exceeds_available():
+    recommender = ProblemRecommender(make_problemset({1500: 2}), [], BASE, EXP)
+    assert sorted(p[0] for p in recommender.recommend(5.0, 3)) == ["1500-0", "1500-1"]
+
+
+def test_recommend_filters_by_tag():
+    problemset = make_problemset({1200: 3}, tags=("dp",)) + [
+        (f"g{i}", 1600, ["greedy"]) for i in range(3)
+    ]
+    recommender = ProblemRecommender(problemset, [], BASE, EXP)
+    picks = recommender.recommend(2.0, 2, tag="greedy")
+    assert [p[0] for p in picks] == ["g0", "g1"]
+    assert recommender.recommend(2.0, 2, tag="math") == []
+
+
+def test_mark_solved_updates_counts_and_picks():
+    recommender = ProblemRecommender(make_problemset({1500: 2}), [], BASE, EXP)
+    recommender.mark_solved("1500-0")
+    assert [p[0] for p in recommender.recommend(5.0, 3)] == ["1500-1"]
+    assert [p[0] for p in recommender.recommend(5.0, 3, tag="dp")] == ["1500-1"]
+    recommender.mark_solved("1500-1")
+    assert recommender.recommend(5.0, 3) == []